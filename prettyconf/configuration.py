@@ -1,20 +1,41 @@
 import ast
 import os
 import sys
+from functools import lru_cache, partial
 
 from .casts import Boolean, JSON, List, Option, Tuple
 from .exceptions import UnknownConfiguration
-from .loaders import Environment, RecursiveSearch
+from .loaders import _MISSING, Environment, RecursiveSearch
 
 MAGIC_FRAME_DEPTH = 2
 
 
+@lru_cache(maxsize=None)
+def _module_path(filename):
+    return os.path.dirname(os.path.abspath(filename))
+
+
 def _caller_path():
     # MAGIC! Get the caller's module path.
     # noinspection PyProtectedMember
     frame = sys._getframe(MAGIC_FRAME_DEPTH)
-    path = os.path.dirname(os.path.abspath(frame.f_code.co_filename))
-    return path
+    return _module_path(frame.f_code.co_filename)
+
+
+def _get_item(loader, item, default=None):
+    try:
+        return loader[item]
+    except KeyError:
+        return default
+
+
+def _getter(loader):
+    # Loaders only need ``__getitem__``, ``get`` is optional
+    get = getattr(loader, "get", None)
+    if get is None:
+        get = partial(_get_item, loader)
+
+    return get
 
 
 class Configuration(object):
@@ -27,7 +48,9 @@ class Configuration(object):
     json = JSON()
 
     def __init__(self, loaders=None):
+        self._cache = {}
         self._recursive_search = None
+        self._caller_path = None
         if loaders is None:
             self._recursive_search = RecursiveSearch()
             loaders = [
@@ -37,6 +60,30 @@ class Configuration(object):
 
         self.loaders = loaders
 
+    @property
+    def loaders(self):
+        return self._loaders
+
+    @loaders.setter
+    def loaders(self, loaders):
+        # Frozen, so lookups can iterate over the loaders' bound ``get``
+        # methods. Replace the whole attribute to change the loaders.
+        self._loaders = tuple(loaders)
+        self._getters = tuple(_getter(loader) for loader in self._loaders)
+        self._cache.clear()
+
+    def invalidate(self):
+        """
+        Forget the values found by previous lookups and the contents read by
+        the loaders. Call it after changing the environment or the
+        configuration files at runtime.
+        """
+        self._cache.clear()
+        for loader in self._loaders:
+            invalidate_cache = getattr(loader, "invalidate_cache", None)
+            if invalidate_cache is not None:
+                invalidate_cache()
+
     def __repr__(self):
         loaders = ', '.join([repr(loader) for loader in self.loaders])
         return '{}(loaders=[{}])'.format(self.__class__.__name__, loaders)
@@ -46,14 +93,28 @@ class Configuration(object):
             raise TypeError("Cast must be callable")
 
         if self._recursive_search:
-            self._recursive_search.starting_path = _caller_path()
+            caller_path = _caller_path()
+            # resolving the starting path is costly, only do it when it changes
+            if caller_path != self._caller_path:
+                self._recursive_search.starting_path = caller_path
+                self._caller_path = caller_path
+
+        # Configuration values are not expected to change while the
+        # application runs, so the raw value found by the first lookup is
+        # reused. Casting still happens on every call to keep casted values
+        # (eg. lists) private to each caller.
+        value = self._cache.get(item, _MISSING)
+        if value is not _MISSING:
+            return cast(value)
 
-        for loader in self.loaders:
-            try:
-                return cast(loader[item])
-            except KeyError:
+        for get in self._getters:
+            value = get(item, _MISSING)
+            if value is _MISSING:
                 continue
 
+            self._cache[item] = value
+            return cast(value)
+
         if 'default' not in kwargs:
             raise UnknownConfiguration("Configuration '{}' not found".format(item))
 
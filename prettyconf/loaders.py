@@ -1,5 +1,7 @@
 import os
-from configparser import ConfigParser, MissingSectionHeaderError, NoOptionError
+import sys
+from configparser import ConfigParser, InterpolationError, MissingSectionHeaderError
+from fnmatch import filter as fnmatch_filter
 from glob import glob
 
 try:
@@ -26,6 +28,51 @@ class NotSet(str):
 
 NOT_SET = NotSet()
 
+# Returned by loaders' ``get`` when a configuration is missing. It can't be
+# ``None`` (or ``NOT_SET``) since these are valid configuration values.
+_MISSING = object()
+
+# Configuration files already parsed by a loader, keyed by the loader type and
+# the file's real path. Each entry also keeps the inode, size, modification and
+# change times of the file so changed files are parsed again. The change time
+# catches files replaced by tools preserving the modification time (eg.
+# ``rsync -a`` or ``cp -p``).
+_PARSED_FILES = {}
+
+
+# Wildcards in file patterns, see ``RecursiveSearch.get_filenames``
+_MAGIC_CHARS = frozenset("*?[")
+
+# Passed as ``names`` to ``RecursiveSearch.get_filenames`` for directories
+# that can't be listed.
+_UNLISTABLE = object()
+
+
+def _intern(name):
+    """
+    Interns variable names read from files and the formatted names used to
+    look them up, so dict lookups match them by identity.
+    """
+    # ``sys.intern`` only accepts exact ``str`` instances
+    return sys.intern(name) if type(name) is str else name
+
+
+def _parse_file(key, filename, parse):
+    """
+    Returns the result of ``parse()`` for ``filename``, reusing a previous
+    result if the file didn't change since it was parsed.
+    """
+    stat = os.stat(filename)
+    stamp = (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
+    cached = _PARSED_FILES.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    parsed = parse()
+    _PARSED_FILES[key] = (stamp, parsed)
+    return parsed
+
 
 def get_args(parser):
     """
@@ -42,6 +89,10 @@ def get_args(parser):
 
 
 class AbstractConfigurationLoader:
+    # Loaders declare their attributes in ``__slots__``. Subclasses that don't
+    # declare them still get a ``__dict__`` as usual.
+    __slots__ = ("__weakref__",)
+
     def __repr__(self):
         raise NotImplementedError()  # pragma: no cover
 
@@ -51,20 +102,70 @@ class AbstractConfigurationLoader:
     def __getitem__(self, item):
         raise NotImplementedError()  # pragma: no cover
 
+    def get(self, item, default=None):
+        """
+        Like ``loader[item]`` but returns ``default`` instead of raising a
+        ``KeyError`` when ``item`` is missing. Loaders should override it with
+        a lookup that does not rely on exceptions whenever possible.
+        """
+        try:
+            return self[item]
+        except KeyError:
+            return default
+
     def check(self):
         return True
 
+    def invalidate_cache(self):
+        """
+        Forget any configuration read by the loader, so it's read again on
+        the next lookup. Loaders that keep nothing don't need to override it.
+        """
+        pass
+
 
 # noinspection PyAbstractClass
 class AbstractConfigurationFileLoader(AbstractConfigurationLoader):
+    __slots__ = ()
     file_filters = ()
 
 
+class _VarFormatLoader(AbstractConfigurationLoader):
+    """
+    Base for loaders that pre-format variable names with ``var_format``.
+    Formatted names are remembered, since lookups for the same variable are
+    repeated all the time.
+    """
+
+    __slots__ = ("_var_format", "_format_cache")
+
+    @property
+    def var_format(self):
+        return self._var_format
+
+    @var_format.setter
+    def var_format(self, var_format):
+        self._var_format = var_format
+        self._format_cache = {}
+
+    def _format_var(self, item):
+        name = self._format_cache.get(item, _MISSING)
+        if name is _MISSING:
+            name = self._format_cache[item] = self._format_name(self._var_format(item))
+
+        return name
+
+    def _format_name(self, name):
+        return name
+
+
 class CommandLine(AbstractConfigurationLoader):
     """
     Extract configuration from an ``argparse`` parser.
     """
 
+    __slots__ = ("parser", "configs")
+
     # noinspection PyShadowingNames
     def __init__(self, parser, get_args=get_args):
         """
@@ -84,8 +185,12 @@ class CommandLine(AbstractConfigurationLoader):
     def __getitem__(self, item):
         return self.configs[item]
 
+    def get(self, item, default=None):
+        return self.configs.get(item, default)
+
 
-class IniFile(AbstractConfigurationFileLoader):
+class IniFile(AbstractConfigurationFileLoader, _VarFormatLoader):
+    __slots__ = ("filename", "section", "_parser", "_options", "_invalid_options", "_initialized")
     file_extensions = ("*.ini", "*.cfg")
 
     def __init__(self, filename, section="settings", var_format=lambda x: x):
@@ -97,32 +202,102 @@ class IniFile(AbstractConfigurationFileLoader):
         self.filename = filename
         self.section = section
         self.var_format = var_format
-        self.parser = ConfigParser(allow_no_value=True)
+        self._parser = None
+        self._options = None
+        self._invalid_options = None
         self._initialized = False
 
     def __repr__(self):
         return 'IniFile("{}")'.format(self.filename)
 
+    @property
+    def parser(self):
+        """
+        The ``ConfigParser`` that read the file, or ``None`` if it wasn't read
+        yet. It's shared by every ``IniFile`` reading the same file, so treat
+        it as read-only.
+        """
+        return self._parser
+
+    @property
+    def _cache_key(self):
+        # Shared by every IniFile reading the same file, whatever the section
+        return self.__class__, os.path.realpath(self.filename)
+
     def _parse(self):
         if self._initialized:
             return
 
+        parser, sections = _parse_file(self._cache_key, self.filename, self._read)
+        if not parser.has_section(self.section):
+            raise MissingSettingsSection("Missing [{}] section in {}".format(self.section, self.filename))
+
+        options = sections.get(self.section)
+        if options is None:
+            options = sections[self.section] = self._read_options(parser)
+
+        self._parser = parser
+        self._options, self._invalid_options = options
+        self._initialized = True
+
+    def _format_name(self, name):
+        return _intern(self._parser.optionxform(name))
+
+    def _read(self):
+        parser = ConfigParser(allow_no_value=True)
         with open(self.filename) as inifile:
             try:
-                self.parser.read_file(inifile)
+                parser.read_file(inifile)
             except (UnicodeDecodeError, MissingSectionHeaderError):
                 raise InvalidConfigurationFile()
 
-        if not self.parser.has_section(self.section):
-            raise MissingSettingsSection("Missing [{}] section in {}".format(self.section, self.filename))
+        # the options already read from each section of the file
+        return parser, {}
 
-        self._initialized = True
+    def _read_options(self, parser):
+        # Interpolate the whole section once, so lookups are plain dict
+        # accesses instead of going through ``ConfigParser.get``.
+        options = {}
+        invalid_options = set()
+        for option in parser.options(self.section):
+            try:
+                options[_intern(option)] = parser.get(self.section, option)
+            except InterpolationError:
+                # looking it up must still fail, see ``_get_option``
+                invalid_options.add(option)
+
+        return options, invalid_options
+
+    def _get_option(self, option, default):
+        value = self._options.get(option, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if option in self._invalid_options:
+            # raises the interpolation error
+            self._parser.get(self.section, option)
+
+        return default
+
+    def invalidate_cache(self):
+        """
+        Parse the file again on the next lookup, even if it looks unchanged.
+        """
+        _PARSED_FILES.pop(self._cache_key, None)
+        self._parser = None
+        self._options = None
+        self._invalid_options = None
+        self._initialized = False
 
     def check(self):
-        try:
-            self._parse()
-        except (FileNotFoundError, InvalidConfigurationFile, MissingSettingsSection):
-            return False
+        if not self._initialized:
+            if not os.path.isfile(self.filename):
+                return False
+
+            try:
+                self._parse()
+            except (FileNotFoundError, InvalidConfigurationFile, MissingSettingsSection):
+                return False
 
         return super().check()
 
@@ -130,23 +305,33 @@ class IniFile(AbstractConfigurationFileLoader):
         if not self.check():
             return False
 
-        return self.parser.has_option(self.section, self.var_format(item))
+        option = self._format_var(item)
+        return option in self._options or option in self._invalid_options
 
     def __getitem__(self, item):
         if not self.check():
             raise KeyError("{!r}".format(item))
 
-        try:
-            return self.parser.get(self.section, self.var_format(item))
-        except NoOptionError:
+        value = self._get_option(self._format_var(item), _MISSING)
+        if value is _MISSING:
             raise KeyError("{!r}".format(item))
 
+        return value
 
-class Environment(AbstractConfigurationLoader):
+    def get(self, item, default=None):
+        if not self.check():
+            return default
+
+        return self._get_option(self._format_var(item), default)
+
+
+class Environment(_VarFormatLoader):
     """
     Get's configuration from the environment, by inspecting ``os.environ``.
     """
 
+    __slots__ = ()
+
     def __init__(self, var_format=str.upper):
         """
         :param function var_format: A function to pre-format variable names.
@@ -157,15 +342,19 @@ class Environment(AbstractConfigurationLoader):
         return "Environment(var_format={})".format(self.var_format)
 
     def __contains__(self, item):
-        return self.var_format(item) in os.environ
+        return self._format_var(item) in os.environ
 
     def __getitem__(self, item):
         # Uses `os.environ` because it raises an exception if the environmental
         # variable does not exist, whilst `os.getenv` doesn't.
-        return os.environ[self.var_format(item)]
+        return os.environ[self._format_var(item)]
+
+    def get(self, item, default=None):
+        return os.environ.get(self._format_var(item), default)
 
 
-class EnvFile(AbstractConfigurationFileLoader):
+class EnvFile(AbstractConfigurationFileLoader, _VarFormatLoader):
+    __slots__ = ("filename", "configs")
     file_extensions = (".env",)
 
     def __init__(self, filename=".env", var_format=str.upper):
@@ -180,22 +369,40 @@ class EnvFile(AbstractConfigurationFileLoader):
     def __repr__(self):
         return 'EnvFile("{}")'.format(self.filename)
 
+    @property
+    def _cache_key(self):
+        return self.__class__, os.path.realpath(self.filename)
+
+    def _format_name(self, name):
+        return _intern(name)
+
     def _parse(self):
         if self.configs is not None:
             return
 
-        self.configs = {}
+        # copied, so changing ``configs`` doesn't affect other loaders
+        self.configs = dict(_parse_file(self._cache_key, self.filename, self._read))
+
+    def _read(self):
         with open(self.filename) as envfile:
-            self.configs.update(EnvFileParser(envfile).parse_config())
+            return {_intern(key): value for key, value in EnvFileParser(envfile).parse_config()}
+
+    def invalidate_cache(self):
+        """
+        Parse the file again on the next lookup, even if it looks unchanged.
+        """
+        _PARSED_FILES.pop(self._cache_key, None)
+        self.configs = None
 
     def check(self):
-        if not os.path.isfile(self.filename):
-            return False
+        if self.configs is None:
+            if not os.path.isfile(self.filename):
+                return False
 
-        try:
-            self._parse()
-        except FileNotFoundError:
-            return False
+            try:
+                self._parse()
+            except FileNotFoundError:
+                return False
 
         return super().check()
 
@@ -203,16 +410,24 @@ class EnvFile(AbstractConfigurationFileLoader):
         if not self.check():
             return False
 
-        return self.var_format(item) in self.configs
+        return self._format_var(item) in self.configs
 
     def __getitem__(self, item):
         if not self.check():
             raise KeyError("{!r}".format(item))
 
-        return self.configs[self.var_format(item)]
+        return self.configs[self._format_var(item)]
+
+    def get(self, item, default=None):
+        if not self.check():
+            return default
+
+        return self.configs.get(self._format_var(item), default)
 
 
 class RecursiveSearch(AbstractConfigurationLoader):
+    __slots__ = ("root_path", "_starting_path", "filetypes", "_config_files")
+
     def __init__(self, starting_path=None, filetypes=((".env", EnvFile), (("*.ini", "*.cfg"), IniFile)), root_path="/"):
         """
         :param str starting_path: The path to begin looking for configuration files.
@@ -246,20 +461,54 @@ class RecursiveSearch(AbstractConfigurationLoader):
         self._starting_path = path
 
     @staticmethod
-    def get_filenames(path, patterns):
-        filenames = []
+    def get_filenames(path, patterns, names=None):
+        """
+        :param str path: Directory to look for files.
+        :param patterns: A pattern (or a tuple of them) to match file names.
+        :param list names: The contents of ``path``, if already listed.
+        :return: The paths in ``path`` matching any of the ``patterns``.
+        """
         if type(patterns) is str:
             patterns = (patterns,)
 
+        if names is None:
+            try:
+                names = os.listdir(path)
+            except OSError:
+                names = _UNLISTABLE
+
+        filenames = []
         for pattern in patterns:
-            filenames += glob(os.path.join(path, pattern))
+            if os.path.dirname(pattern):
+                # patterns with a directory part can't match listed names
+                filenames += glob(os.path.join(path, pattern))
+                continue
+
+            if names is _UNLISTABLE:
+                # Directories we can't list (eg. mode 711) can still be
+                # searched for exact file names, as ``glob`` does.
+                filename = os.path.join(path, pattern)
+                if not _MAGIC_CHARS.intersection(pattern) and os.path.lexists(filename):
+                    filenames.append(filename)
+                continue
+
+            matches = fnmatch_filter(names, pattern)
+            if not pattern.startswith("."):
+                # like ``glob``, wildcards do not match hidden files
+                matches = [name for name in matches if not name.startswith(".")]
+            filenames += [os.path.join(path, name) for name in matches]
         return filenames
 
     def _scan_path(self, path):
         config_files = []
 
+        try:
+            names = os.listdir(path)
+        except OSError:
+            names = _UNLISTABLE
+
         for patterns, Loader in self.filetypes:
-            for filename in self.get_filenames(path, patterns):
+            for filename in self.get_filenames(path, patterns, names):
                 try:
                     loader = Loader(filename=filename)
                     if not loader.check():
@@ -283,6 +532,16 @@ class RecursiveSearch(AbstractConfigurationLoader):
 
             path = os.path.dirname(path)
 
+    def invalidate_cache(self):
+        """
+        Parse the configuration files again and look for new ones on the
+        next lookup.
+        """
+        for config_file in self._config_files or ():
+            config_file.invalidate_cache()
+
+        self._config_files = None
+
     @property
     def config_files(self):
         if self._config_files is None:
@@ -308,8 +567,21 @@ class RecursiveSearch(AbstractConfigurationLoader):
         else:
             raise KeyError("{!r}".format(item))
 
+    def get(self, item, default=None):
+        for config_file in self.config_files:
+            value = config_file.get(item, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        return default
+
 
 class AwsParameterStore(AbstractConfigurationLoader):
+    __slots__ = (
+        "path", "aws_access_key_id", "aws_secret_access_key", "region_name", "endpoint_url",
+        "_fetched", "_parameters",
+    )
+
     def __init__(self, path="/", aws_access_key_id=None, aws_secret_access_key=None, region_name="us-east-1", endpoint_url=None):
         if not boto3:
             raise RuntimeError(
@@ -352,10 +624,11 @@ class AwsParameterStore(AbstractConfigurationLoader):
         self._fetched = True
 
     def check(self):
-        try:
-            self._fetch_parameters()
-        except (botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError):
-            return False
+        if not self._fetched:
+            try:
+                self._fetch_parameters()
+            except (botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError):
+                return False
 
         return super().check()
 
@@ -373,3 +646,9 @@ class AwsParameterStore(AbstractConfigurationLoader):
             raise KeyError("{!r}".format(item))
 
         return self._parameters[item]
+
+    def get(self, item, default=None):
+        if not self.check():
+            return default
+
+        return self._parameters.get(item, default)
@@ -1,3 +1,4 @@
+import re
 from typing import Union, Tuple, Iterator
 
 STATE_INITIAL = "initial"
@@ -12,37 +13,16 @@ ESCAPE_CHAR = "\\"
 SPACES = set(" \n")
 QUOTES = set("'\"")
 
-
-class BufferedStreamReader:
-    BUFFER_SIZE = 1024
-
-    def __init__(self, stream):
-        self.stream = stream
-        self.buffer = stream.read(self.BUFFER_SIZE)
-        self.position = 0
-
-    def read_char(self):
-        if self._is_buffer_depleted():
-            self._fill_buffer()
-            if not self.buffer:
-                return None
-
-        char = self.buffer[self.position]
-        self.position += 1
-        return char
-
-    def _is_buffer_depleted(self):
-        return self.position >= len(self.buffer)
-
-    def _fill_buffer(self):
-        self.buffer = self.stream.read(self.BUFFER_SIZE)
-        self.position = 0
+# A ``KEY=value`` line without quotes, comments or escapes. These lines are the
+# vast majority in .env files and give the same result as the char-by-char
+# parsing below, so they're matched at once.
+SIMPLE_CONFIG_LINE = re.compile(r"^ *([^ \n#'\"=][^\n#'\"=]*)= *([^\n#'\"\\]*)\n?$")
 
 
 class EnvFileParser:
     def __init__(self, stream):
         self.state = STATE_INITIAL
-        self._stream = BufferedStreamReader(stream)
+        self._stream = stream
 
         self._current_key = []
         self._current_value = []
@@ -50,42 +30,44 @@ class EnvFileParser:
         self._key_parsed = False
 
     def parse_config(self) -> Iterator[Tuple[str, str]]:
-        key = self._current_key
-        value = self._current_value
+        for line in self._stream:
+            if self.state == STATE_INITIAL and not self._current_quote:
+                match = SIMPLE_CONFIG_LINE.match(line)
+                if match:
+                    key, value = match.groups()
+                    yield key.rstrip(), value.rstrip()
+                    continue
+
+            for char in line:
+                parsed_value = self._process_char(char)
+                if isinstance(parsed_value, tuple):
+                    yield parsed_value
 
-        while True:
-            char = self._stream.read_char()
-            if not char:
-                if key or value:
-                    yield self._return_current_config()
-                break
+        if self._current_key or self._current_value:
+            yield self._return_current_config()
 
-            if self._process_initial(char):
-                continue
+    def _process_char(self, char) -> Union[bool, Tuple[str, str]]:
+        if self._process_initial(char):
+            return True
 
-            if self._process_quotes(char):
-                continue
+        if self._process_quotes(char):
+            return True
 
-            if self._start_comment(char):
-                continue
+        if self._start_comment(char):
+            return True
 
-            parsed_value = self._finish_comment(char)
-            if parsed_value:
-                if isinstance(parsed_value, tuple):
-                    yield parsed_value
-                continue
+        parsed_value = self._finish_comment(char)
+        if parsed_value:
+            return parsed_value
 
-            if self._parse_key(char):
-                continue
+        if self._parse_key(char):
+            return True
 
-            parsed_value = self._parse_value(char)
-            if parsed_value:
-                if isinstance(parsed_value, tuple):
-                    yield parsed_value
-                continue
+        parsed_value = self._parse_value(char)
+        if parsed_value:
+            return parsed_value
 
-            if self._parse_escaped_value(char):
-                continue
+        return self._parse_escaped_value(char)
 
     def _start_comment(self, char):
         if char == COMMENT and (not self._current_quote or self.state == STATE_INITIAL):
@@ -1,5 +1,9 @@
+import os
+from configparser import InterpolationMissingOptionError
+
 import pytest
 
+from prettyconf.configuration import Configuration
 from prettyconf.loaders import IniFile
 
 
@@ -68,3 +72,117 @@ def test_fail_missing_envfile_get_item():
     config = IniFile("does-not-exist.ini")
     with pytest.raises(KeyError):
         return config['error']
+
+
+def test_get_config(inifile):
+    config = IniFile(inifile)
+
+    assert config.get("KEY") == "Value"
+    assert config.get("KEY_EMPTY", "default") == ""
+    assert config.get("COMMENTED_KEY") is None
+    assert config.get("COMMENTED_KEY", "default") == "default"
+
+
+def test_fail_missing_inifile_get():
+    config = IniFile("does-not-exist.ini")
+    assert config.get("error", "default") == "default"
+
+
+def test_case_insensitive_options(inifile):
+    config = IniFile(inifile)
+
+    assert "key" in config
+    assert config["key"] == "Value"
+    assert config.get("key") == "Value"
+
+
+def test_fail_invalid_interpolation(create_file, files_path):
+    filename = files_path + "/../interpolation.ini"
+    create_file(filename, "[settings]\nKEY=Value\nBROKEN=%(unknown)s\n")
+    config = IniFile(filename)
+
+    assert config["KEY"] == "Value"
+    assert "BROKEN" in config
+    with pytest.raises(InterpolationMissingOptionError):
+        config.get("BROKEN")
+    with pytest.raises(InterpolationMissingOptionError):
+        return config["BROKEN"]
+
+    configuration = Configuration(loaders=[config])
+    with pytest.raises(InterpolationMissingOptionError):
+        configuration("BROKEN", default=None)
+
+
+def test_reuse_parsed_file(inifile):
+    config = IniFile(inifile)
+    other = IniFile(inifile)
+    config.check()
+    other.check()
+
+    assert other.parser is config.parser
+    assert IniFile(inifile, section="other").get("KEY") is None
+
+
+def test_parse_changed_file_again(create_file, files_path):
+    filename = files_path + "/../cached.ini"
+    create_file(filename, "[settings]\nKEY=Value\n")
+    assert IniFile(filename)["KEY"] == "Value"
+
+    with open(filename, "a") as file_:
+        file_.write("OTHER=Other Value\n")
+
+    assert IniFile(filename)["OTHER"] == "Other Value"
+
+
+def test_invalidate_cache(create_file, files_path):
+    filename = files_path + "/../cached.ini"
+    create_file(filename, "[settings]\nKEY=Value\n")
+    config = IniFile(filename)
+    assert config["KEY"] == "Value"
+
+    with open(filename, "w") as file_:
+        file_.write("[settings]\nKEY=Other\n")
+
+    assert config["KEY"] == "Value"
+    config.invalidate_cache()
+    assert config["KEY"] == "Other"
+
+
+def test_parse_replaced_file_with_same_size_and_mtime_again(create_file, files_path):
+    filename = files_path + "/../cached.ini"
+    create_file(filename, "[settings]\nKEY=Value\n")
+    assert IniFile(filename)["KEY"] == "Value"
+
+    stat = os.stat(filename)
+    with open(filename, "w") as file_:
+        file_.write("[settings]\nKEY=Other\n")
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert IniFile(filename)["KEY"] == "Other"
+
+
+def test_directory_is_not_a_valid_file(files_path):
+    config = IniFile(files_path)
+    assert not config.check()
+    assert 'error' not in config
+
+
+def test_share_parsed_file_between_sections(create_file, files_path):
+    filename = files_path + "/../sections.ini"
+    create_file(filename, "[settings]\nKEY=Value\n[other]\nKEY=Other Value\n")
+    config = IniFile(filename)
+    other = IniFile(filename, section="other")
+
+    assert config["KEY"] == "Value"
+    assert other["KEY"] == "Other Value"
+    assert other.parser is config.parser
+
+
+def test_parser_is_read_only(inifile):
+    config = IniFile(inifile)
+    assert config.parser is None
+
+    config.check()
+    assert config.parser.has_section("settings")
+    with pytest.raises(AttributeError):
+        config.parser = None
@@ -34,3 +34,9 @@ def test_does_not_ignore_set_values():
 
 def test_contains_missing_keys(command_line_config):
     assert 'var3' not in command_line_config
+
+
+def test_get_config(command_line_config):
+    assert command_line_config.get('var2') == 'foo'
+    assert command_line_config.get('var') is None
+    assert command_line_config.get('var3', 'default') == 'default'
@@ -1,10 +1,11 @@
 import os
+import pickle
 
 import pytest
 
 from prettyconf.configuration import Configuration
 from prettyconf.exceptions import UnknownConfiguration
-from prettyconf.loaders import EnvFile, Environment, IniFile
+from prettyconf.loaders import AbstractConfigurationLoader, EnvFile, Environment, IniFile, RecursiveSearch
 
 
 def test_basic_config(env_config, ini_config):
@@ -66,3 +67,150 @@ def test_fail_unknown_config_without_default_value():
 def test_none_as_default_value():
     config = Configuration()
     assert config("UNKNOWN", default=None) is None
+
+
+def test_config_caches_found_values():
+    os.environ["CACHED"] = "first"
+    config = Configuration()
+    assert config("CACHED") == "first"
+
+    os.environ["CACHED"] = "second"
+    assert config("CACHED") == "first"
+    assert config("CACHED", cast=str.upper) == "FIRST"
+
+    config.invalidate()
+    assert config("CACHED") == "second"
+    del os.environ["CACHED"]
+
+
+def test_config_does_not_cache_default_values():
+    config = Configuration()
+    assert config("NOT_CACHED", default="default") == "default"
+
+    os.environ["NOT_CACHED"] = "value"
+    assert config("NOT_CACHED", default="default") == "value"
+    del os.environ["NOT_CACHED"]
+
+
+def test_config_cast_values_are_not_shared():
+    os.environ["LIST"] = "a,b"
+    config = Configuration()
+    config("LIST", cast=config.list).append("c")
+    assert config("LIST", cast=config.list) == ["a", "b"]
+    del os.environ["LIST"]
+
+
+def test_replacing_loaders_invalidates_cache():
+    os.environ["CACHED"] = "value"
+    config = Configuration()
+    assert config("CACHED") == "value"
+
+    config.loaders = []
+    assert config("CACHED", default=None) is None
+    del os.environ["CACHED"]
+
+
+def test_recursive_search_starts_at_caller_path():
+    config = Configuration()
+    config("UNKNOWN", default=None)
+    config("UNKNOWN", default=None)
+
+    starting_path = os.path.realpath(os.path.dirname(__file__))
+    assert config._recursive_search.starting_path == starting_path
+
+
+def test_loaders_are_frozen():
+    config = Configuration(loaders=[Environment()])
+
+    assert isinstance(config.loaders, tuple)
+    with pytest.raises(AttributeError):
+        config.loaders.append(EnvFile())
+
+
+def test_invalidate_reads_changed_files(create_dir):
+    root_dir, path = create_dir()
+    envfile = os.path.join(path, ".env")
+    with open(envfile, "w") as file_:
+        file_.write("FOO=one\n")
+
+    loaders = [EnvFile(envfile), RecursiveSearch(path, root_path=root_dir)]
+    config = Configuration(loaders=loaders)
+    assert config("FOO") == "one"
+    assert loaders[1]["FOO"] == "one"
+
+    with open(envfile, "w") as file_:
+        file_.write("FOO=twotwo\n")
+
+    config.invalidate()
+    assert config("FOO") == "twotwo"
+    assert loaders[1]["FOO"] == "twotwo"
+
+
+def test_invalidate_default_configuration_reads_changed_files(create_file, files_path):
+    envfile = files_path + "/../.env"
+    create_file(envfile, "FOO=one\n")
+    config = Configuration()
+    assert config("FOO") == "one"
+
+    with open(envfile, "w") as file_:
+        file_.write("FOO=twotwo\n")
+
+    config.invalidate()
+    assert config("FOO") == "twotwo"
+
+
+def test_custom_loader_without_get():
+    class DictLoader(AbstractConfigurationLoader):
+        def __init__(self, configs):
+            self.configs = configs
+
+        def __repr__(self):
+            return "DictLoader()"
+
+        def __contains__(self, item):
+            return item in self.configs
+
+        def __getitem__(self, item):
+            return self.configs[item]
+
+    config = Configuration(loaders=[DictLoader({"FOO": "bar"})])
+    assert config("FOO") == "bar"
+    assert config("UNKNOWN", default="default") == "default"
+    with pytest.raises(UnknownConfiguration):
+        config("UNKNOWN")
+
+
+def test_pickle_configuration():
+    os.environ["PICKLED"] = "value"
+    config = Configuration()
+    assert config("PICKLED") == "value"
+
+    unpickled = pickle.loads(pickle.dumps(config))
+    assert unpickled("PICKLED") == "value"
+    assert pickle.loads(pickle.dumps(Configuration()))("PICKLED") == "value"
+    del os.environ["PICKLED"]
+
+
+def test_plain_dict_loader():
+    config = Configuration(loaders=[{"FOO": "bar"}])
+    assert config("FOO") == "bar"
+    assert config("UNKNOWN", default="default") == "default"
+
+    config.invalidate()
+    assert config("FOO") == "bar"
+    assert pickle.loads(pickle.dumps(config))("FOO") == "bar"
+
+
+def test_loader_with_getitem_only():
+    class GetItemLoader:
+        def __getitem__(self, item):
+            if item != "FOO":
+                raise KeyError(item)
+            return "bar"
+
+    config = Configuration(loaders=[GetItemLoader()])
+    assert config("FOO") == "bar"
+    assert config("UNKNOWN", default="default") == "default"
+
+    config.invalidate()
+    assert config("FOO") == "bar"
@@ -1,3 +1,7 @@
+import os
+import pickle
+import sys
+
 import pytest
 
 from prettyconf.loaders import EnvFile
@@ -64,3 +68,88 @@ def test_fail_missing_envfile_get_item():
     config = EnvFile("does-not-exist.env")
     with pytest.raises(KeyError):
         return config["error"]
+
+
+def test_get_config(envfile):
+    config = EnvFile(envfile)
+
+    assert config.get("KEY") == "Value"
+    assert config.get("KEY_EMPTY", "default") == ""
+    assert config.get("COMMENTED_KEY") is None
+    assert config.get("COMMENTED_KEY", "default") == "default"
+
+
+def test_fail_missing_envfile_get():
+    config = EnvFile("does-not-exist.env")
+    assert config.get("error", "default") == "default"
+
+
+def test_reuse_parsed_file(create_file, files_path):
+    filename = files_path + "/../cached.env"
+    create_file(filename, "KEY=Value\n")
+
+    config = EnvFile(filename)
+    assert config["KEY"] == "Value"
+
+    other = EnvFile(filename)
+    other.check()
+    assert other.configs == config.configs
+
+    other.configs["KEY"] = "Changed"
+    assert config["KEY"] == "Value"
+    assert EnvFile(filename)["KEY"] == "Value"
+
+
+def test_parse_changed_file_again(create_file, files_path):
+    filename = files_path + "/../cached.env"
+    create_file(filename, "KEY=Value\n")
+    assert EnvFile(filename)["KEY"] == "Value"
+
+    with open(filename, "a") as file_:
+        file_.write("OTHER=Other Value\n")
+
+    assert EnvFile(filename)["OTHER"] == "Other Value"
+
+
+def test_invalidate_cache(create_file, files_path):
+    filename = files_path + "/../cached.env"
+    create_file(filename, "KEY=Value\n")
+    config = EnvFile(filename)
+    assert config["KEY"] == "Value"
+
+    with open(filename, "w") as file_:
+        file_.write("KEY=Other\n")
+
+    assert config["KEY"] == "Value"
+    config.invalidate_cache()
+    assert config["KEY"] == "Other"
+
+
+def test_parse_replaced_file_with_same_size_and_mtime_again(create_file, files_path):
+    filename = files_path + "/../cached.env"
+    create_file(filename, "KEY=Value\n")
+    assert EnvFile(filename)["KEY"] == "Value"
+
+    stat = os.stat(filename)
+    with open(filename, "w") as file_:
+        file_.write("KEY=Other\n")
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert EnvFile(filename)["KEY"] == "Other"
+
+
+def test_variable_names_are_interned(envfile):
+    config = EnvFile(envfile)
+    config.check()
+
+    name = "".join(["K", "E", "Y"])
+    assert [key for key in config.configs if key == name][0] is sys.intern(name)
+
+
+def test_pickle_loader(envfile):
+    config = EnvFile(envfile)
+    assert config["KEY"] == "Value"
+
+    unpickled = pickle.loads(pickle.dumps(config))
+    assert unpickled["KEY"] == "Value"
+    assert pickle.loads(pickle.dumps(EnvFile(envfile)))["KEY"] == "Value"
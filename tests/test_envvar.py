@@ -43,3 +43,57 @@ def test_custom_var_format():
     assert "test" == config["TEST"]
 
     del os.environ["_TEST"]
+
+
+def test_get_config():
+    os.environ["TEST"] = "test"
+    config = Environment()
+
+    assert "test" == config.get("test")
+    assert config.get("UNKNOWN") is None
+    assert "default" == config.get("UNKNOWN", "default")
+
+    del os.environ["TEST"]
+
+
+def test_var_format_is_called_once_per_variable():
+    calls = []
+
+    def formatter(x):
+        calls.append(x)
+        return x.upper()
+
+    os.environ["TEST"] = "test"
+    config = Environment(var_format=formatter)
+
+    assert "test" == config["test"]
+    assert "test" == config.get("test")
+    assert "test" in config
+    assert calls == ["test"]
+
+    del os.environ["TEST"]
+
+
+def test_custom_attributes_in_subclass():
+    class CustomEnvironment(Environment):
+        def __init__(self):
+            super().__init__()
+            self.prefix = "CUSTOM_"
+
+    config = CustomEnvironment()
+    assert config.prefix == "CUSTOM_"
+    with pytest.raises(AttributeError):
+        Environment().prefix = "CUSTOM_"
+
+
+def test_change_var_format():
+    os.environ["TEST"] = "test"
+    os.environ["_TEST"] = "other"
+    config = Environment()
+    assert "test" == config["test"]
+
+    config.var_format = lambda x: "_{}".format(x.upper())
+    assert "other" == config["test"]
+
+    del os.environ["TEST"]
+    del os.environ["_TEST"]
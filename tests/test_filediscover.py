@@ -1,9 +1,10 @@
 import os
+from unittest import mock
 
 import pytest
 
 from prettyconf.exceptions import InvalidPath
-from prettyconf.loaders import RecursiveSearch
+from prettyconf.loaders import IniFile, RecursiveSearch
 
 
 def test_config_file_parsing(create_file, files_path):
@@ -105,3 +106,81 @@ def test_env_dir_wont_break_loader(files_path):
         os.removedirs(env_directory)
 
     assert 'FOO' not in discovery
+
+
+def test_get_config(create_file, files_path):
+    create_file(files_path + "/../.env", "SPAM=eggs")
+    create_file(files_path + "/../settings.ini", "[settings]\nFOO=bar")
+    discovery = RecursiveSearch(os.path.dirname(files_path))
+
+    assert discovery.get('FOO') == 'bar'
+    assert discovery.get('SPAM') == 'eggs'
+    assert discovery.get('not_found') is None
+    assert discovery.get('not_found', 'default') == 'default'
+
+
+def test_get_filenames(create_dir):
+    root_dir, path = create_dir("some/dir")
+    for name in ("settings.ini", "other.cfg", ".hidden.ini", ".env", "setup.txt"):
+        with open(os.path.join(path, name), "a"):
+            pass
+
+    filenames = RecursiveSearch.get_filenames(path, ("*.ini", "*.cfg"))
+    assert sorted(filenames) == [os.path.join(path, "other.cfg"), os.path.join(path, "settings.ini")]
+    assert RecursiveSearch.get_filenames(path, ".env") == [os.path.join(path, ".env")]
+    assert RecursiveSearch.get_filenames(path, ".*.ini") == [os.path.join(path, ".hidden.ini")]
+    assert RecursiveSearch.get_filenames(os.path.join(path, "missing"), "*.ini") == []
+
+
+def test_get_exact_filenames_from_unreadable_directory(create_dir):
+    root_dir, path = create_dir("some/dir")
+    for name in (".env", "settings.ini"):
+        with open(os.path.join(path, name), "a"):
+            pass
+
+    with mock.patch("prettyconf.loaders.os.listdir", side_effect=PermissionError):
+        assert RecursiveSearch.get_filenames(path, ".env") == [os.path.join(path, ".env")]
+        assert RecursiveSearch.get_filenames(path, (".env", "missing.ini")) == [os.path.join(path, ".env")]
+        assert RecursiveSearch.get_filenames(path, ("*.ini", "*.cfg")) == []
+
+
+def test_discover_config_files_in_unreadable_directory(create_dir):
+    root_dir, path = create_dir("some/dir")
+    with open(os.path.join(path, ".env"), "w") as file_:
+        file_.write("SPAM=eggs")
+    with open(os.path.join(path, "settings.ini"), "w") as file_:
+        file_.write("[settings]\nFOO=bar")
+
+    with mock.patch("prettyconf.loaders.os.listdir", side_effect=PermissionError):
+        discovery = RecursiveSearch(path, root_path=root_dir)
+        filenames = [cfg.filename for cfg in discovery.config_files]
+
+    assert filenames == [os.path.join(os.path.realpath(path), ".env")]
+    assert discovery['SPAM'] == 'eggs'
+    assert 'FOO' not in discovery
+
+
+def test_get_filenames_in_subdirectories(create_dir):
+    root_dir, path = create_dir("some/dir/conf")
+    with open(os.path.join(path, "app.ini"), "w") as file_:
+        file_.write("[settings]\nFOO=bar")
+
+    start_path = os.path.dirname(path)
+    expected = [os.path.join(path, "app.ini")]
+    assert RecursiveSearch.get_filenames(start_path, "conf/*.ini") == expected
+    assert RecursiveSearch.get_filenames(start_path, "*/app.ini") == expected
+
+    discovery = RecursiveSearch(start_path, filetypes=(("conf/*.ini", IniFile),), root_path=root_dir)
+    assert discovery['FOO'] == 'bar'
+
+
+def test_list_unreadable_directory_once(create_dir):
+    root_dir, path = create_dir("some/dir")
+    with open(os.path.join(path, ".env"), "w") as file_:
+        file_.write("SPAM=eggs")
+
+    with mock.patch("prettyconf.loaders.os.listdir", side_effect=PermissionError) as listdir:
+        discovery = RecursiveSearch(path, root_path=path)
+        assert discovery['SPAM'] == 'eggs'
+
+    assert listdir.call_count == 1
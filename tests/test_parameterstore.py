@@ -103,3 +103,21 @@ def test_parameter_store_access_fail(mock_boto):
     assert "DATABASE_URL" not in config
     with pytest.raises(KeyError):
         config["DATABASE_URL"]
+
+
+@mock.patch("prettyconf.loaders.boto3")
+def test_get_config(mock_boto):
+    mock_boto.client.return_value.get_parameters_by_path.return_value = PARAMETER_RESPONSE
+    config = AwsParameterStore()
+
+    assert config.get("HOST") == "host_url"
+    assert config.get("DATABASE_URL") is None
+    assert config.get("DATABASE_URL", "default") == "default"
+
+
+@mock.patch("prettyconf.loaders.boto3")
+def test_parameter_store_access_fail_get(mock_boto):
+    mock_boto.client.return_value.get_parameters_by_path.side_effect = BotoCoreError
+    config = AwsParameterStore()
+
+    assert config.get("DATABASE_URL", "default") == "default"